@@ -0,0 +1,56 @@
+"""Fixtures and timing shared by the benchmark scripts"""
+import random
+import time
+
+from datetime import datetime, timedelta, timezone
+
+
+def synthetic_track(points: int, seed: int = 0) -> list[dict]:
+    """Builds a day of GPS points for one vehicle, moving between a handful of addresses"""
+    rng = random.Random(seed)
+    addresses = [{
+        'AddressLine1': f'{rng.randint(100, 9999)} Main St',
+        'AddressLine2': '',
+        'Locality': 'Milwaukee',
+        'AdministrativeArea': 'WI',
+        'PostalCode': f'532{rng.randint(10, 99)}',
+        'Country': 'USA',
+    } for _ in range(40)]
+
+    update = datetime(2024, 7, 1, tzinfo=timezone.utc)
+    latitude, longitude, odometer = 43.038902, -87.906471, 152340.5
+    track = []
+    for _ in range(points):
+        speed = round(max(0.0, rng.gauss(45, 20)), 1)
+        update += timedelta(seconds=rng.choice((30, 30, 30, 60)))
+        latitude = round(latitude + rng.uniform(-0.002, 0.002), 6)
+        longitude = round(longitude + rng.uniform(-0.002, 0.002), 6)
+        odometer = round(odometer + speed / 120, 1)
+        track.append({
+            'Latitude': latitude,
+            'Longitude': longitude,
+            'VehicleNumber': '1042',
+            'VehicleName': 'Truck 1042 - Service',
+            'OdometerInKM': odometer,
+            'UpdateUtc': update.strftime('%Y-%m-%dT%H:%M:%S'),
+            'IsPrivate': False,
+            'DriverNumber': 'D-2231',
+            'FirstName': 'Jamie',
+            'LastName': 'Smith',
+            'Address': rng.choice(addresses),
+            'Speed': speed,
+            'BatteryLevel': None,
+            'TractionBatteryChargingLastStartUtc': None,
+            'TractionBatteryChargingUtc': None,
+        })
+    return track
+
+
+def timed(func, repeat: int = 5) -> float:
+    """Returns the best wall time of several runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
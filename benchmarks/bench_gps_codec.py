@@ -0,0 +1,45 @@
+"""
+Compares the GPS track archival format against gzip'd JSON on a synthetic vehicle_gps_history response.
+
+Run with ``python benchmarks/bench_gps_codec.py``.
+"""
+import gzip
+import json
+
+from _common import synthetic_track, timed
+from datetime import datetime, timedelta, timezone
+from verizon_connect_api.gps_codec import GPSTrackArchive, encode_gps_track
+
+
+def main():
+    track = synthetic_track(2880)
+    raw = json.dumps(track).encode('utf-8')
+    gzipped = gzip.compress(raw)
+    encoded = encode_gps_track(track)
+    assert GPSTrackArchive(encoded).decode() == track
+
+    archive = GPSTrackArchive(encoded)
+    hour_start = datetime(2024, 7, 1, 12, tzinfo=timezone.utc)
+    hour_end = hour_start + timedelta(hours=1)
+
+    print(f'{len(track)} points')
+    print(f'{"format":<20}{"bytes":>10}{"bytes/point":>14}')
+    for name, size in (('json', len(raw)), ('json + gzip', len(gzipped)), ('gps codec', len(encoded)),
+                       ('gps codec + gzip', len(gzip.compress(encoded)))):
+        print(f'{name:<20}{size:>10}{size / len(track):>14.1f}')
+
+    print()
+    print(f'{"operation":<28}{"ms":>10}{"points/s":>12}')
+    for name, func, points in (
+            ('json + gzip encode', lambda: gzip.compress(json.dumps(track).encode('utf-8')), len(track)),
+            ('json + gzip decode', lambda: json.loads(gzip.decompress(gzipped)), len(track)),
+            ('gps codec encode', lambda: encode_gps_track(track), len(track)),
+            ('gps codec decode', lambda: GPSTrackArchive(encoded).decode(), len(track)),
+            ('gps codec decode 1 hour', lambda: archive.decode(hour_start, hour_end),
+             len(archive.decode(hour_start, hour_end)))):
+        seconds = timed(func)
+        print(f'{name:<28}{seconds * 1000:>10.2f}{points / seconds:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Measures the per-record overhead of response validation on a synthetic vehicle_gps_history response, compared with
+the strict pydantic TypeAdapter used by the test suite (if pydantic is installed).
+
+Run with ``python benchmarks/bench_validation.py``.
+"""
+from _common import synthetic_track, timed
+from verizon_connect_api.api_types import VehicleGPSLocation
+from verizon_connect_api.validation import ResponseValidator, compile_validator
+
+
+def main():
+    track = synthetic_track(2880)
+    response_type = list[VehicleGPSLocation]
+
+    validator = ResponseValidator(default_rate=0.01, seed=0)
+
+    def sampled():
+        for _ in range(100):
+            validator.validate('vehicle_gps_history', track, response_type)
+
+    def compile_uncached():
+        compile_validator.cache_clear()
+        compile_validator(response_type)
+
+    print(f'compiling validator: {timed(compile_uncached) * 1e6:.0f} us\n')
+    check = compile_validator(response_type)
+
+    runs = [
+        ('compiled validator', lambda: check(track, '', lambda *args: None), len(track)),
+        ('sampled at 0.01', sampled, 100 * len(track)),
+    ]
+
+    try:
+        from pydantic import ConfigDict, TypeAdapter
+    except ImportError:
+        print('pydantic not installed, skipping TypeAdapter comparison\n')
+    else:
+        VehicleGPSLocation.__pydantic_config__ = ConfigDict(extra='forbid')
+        adapter = TypeAdapter(response_type)
+        runs.append(('pydantic TypeAdapter', lambda: adapter.validate_python(track, strict=True), len(track)))
+
+    print(f'{len(track)} records')
+    print(f'{"validation":<24}{"us/record":>12}')
+    for name, func, records in runs:
+        print(f'{name:<24}{timed(func) / records * 1e6:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,9 +2,27 @@ import requests
 
 from base64 import b64encode
 from datetime import datetime, timezone
+from functools import wraps
+from typing import get_type_hints
 from urllib.parse import quote
 
 from verizon_connect_api.api_types import *
+from verizon_connect_api.scheduler import Priority, PriorityStats, RequestScheduler
+from verizon_connect_api.validation import ResponseValidator
+
+
+def _validated(method):
+    """Passes responses from an endpoint method to the client's validator, checked against the return type"""
+    response_type = get_type_hints(method)['return']
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        response = method(self, *args, **kwargs)
+        if self._validator is not None:
+            self._validator.validate(method.__name__, response, response_type)
+        return response
+
+    return wrapper
 
 
 class VerizonConnectAPI:
@@ -21,16 +39,25 @@ class VerizonConnectAPI:
     :type password: str
     :param api_url: API endpoint, defaults to 'https://fim.api.us.fleetmatics.com:443/'
     :type api_url: str
+    :param scheduler: Optional scheduler shared by threads using this client to prioritize interactive requests over
+        bulk history requests, defaults to None (requests are sent immediately)
+    :type scheduler: RequestScheduler
+    :param validator: Optional validator checking a sample of responses for schema drift, defaults to None
+    :type validator: ResponseValidator
     """
 
-    def __init__(self, app_id: str, username: str, password: str, api_url='https://fim.api.us.fleetmatics.com:443/'):
+    def __init__(self, app_id: str, username: str, password: str, api_url='https://fim.api.us.fleetmatics.com:443/',
+                 scheduler: Optional[RequestScheduler] = None, validator: Optional[ResponseValidator] = None):
         self._URL_BASE = api_url
         self._APP_ID = app_id
+        self._scheduler = scheduler
+        self._validator = validator
 
         encoded_credentials = b64encode(f"{username}:{password}".encode("utf-8"))
         self._BASIC_AUTH_HEADER = f'Basic {encoded_credentials.decode("utf-8")}'
         self._token = self._get_token()
 
+    @_validated
     def drivers(self) -> list[Driver]:
         """
         Gets driver information for all drivers.
@@ -42,6 +69,7 @@ class VerizonConnectAPI:
         """
         return self._json_request(f"cmd/v1/drivers")
 
+    @_validated
     def driver(self, driver_number: str) -> Driver:
         """
         Gets driver information for a specific driver.
@@ -55,6 +83,7 @@ class VerizonConnectAPI:
         """
         return self._json_request(f"cmd/v1/drivers/{self._format_string(driver_number)}")
 
+    @_validated
     def driver_keys(self, driver_number: str) -> list[str]:
         """
         Gets driver's key fob IDs.
@@ -68,6 +97,7 @@ class VerizonConnectAPI:
         """
         return self._json_request(f"cmd/v1/drivers/{self._format_string(driver_number)}/keys")
 
+    @_validated
     def driver_logbook_settings(self, driver_number: str) -> DriverLogBookSettingsResponse:
         """
         Gets driver's logbook settings.
@@ -81,6 +111,7 @@ class VerizonConnectAPI:
         """
         return self._json_request(f"cmd/v1/driversettings/logbooksettings/{self._format_string(driver_number)}")
 
+    @_validated
     def driver_segments(self, driver_number: str, start: datetime) -> list[SegmentHistory]:
         """
         Gets driver's vehicles ignition start and stop times for 24-hour period
@@ -98,8 +129,10 @@ class VerizonConnectAPI:
             raise ValueError('Start datetime cannot be in the future')
 
         return self._json_request(
-            f"rad/v1/drivers/{self._format_string(driver_number)}/segments?startdateutc={self._format_date(start)}")
+            f"rad/v1/drivers/{self._format_string(driver_number)}/segments?startdateutc={self._format_date(start)}",
+            priority=Priority.BULK)
 
+    @_validated
     def users(self) -> list[UserResponse]:
         """
         Gets application users
@@ -111,6 +144,7 @@ class VerizonConnectAPI:
         """
         return self._json_request(f"cmd/v1/users")
 
+    @_validated
     def user(self, employee_id: int) -> UserResponse:
         """
         Gets application user
@@ -124,6 +158,7 @@ class VerizonConnectAPI:
         """
         return self._json_request(f"cmd/v1/users/{employee_id}")
 
+    @_validated
     def vehicles(self) -> list[Vehicle]:
         """
         Gets basic vehicle information for all vehicles.
@@ -135,6 +170,7 @@ class VerizonConnectAPI:
         """
         return self._json_request(f"cmd/v1/vehicles")
 
+    @_validated
     def vehicle(self, vehicle_number: str) -> Vehicle:
         """
         Gets basic vehicle information for a specific vehicle.
@@ -148,6 +184,7 @@ class VerizonConnectAPI:
         """
         return self._json_request(f"cmd/v1/vehicles/{self._format_string(vehicle_number)}")
 
+    @_validated
     def active_dtcs(self) -> list[ActiveDiagnosticTroubleCodes]:
         """
         Gets active diagnostic trouble codes (DTCs) for all vehicles.
@@ -159,6 +196,7 @@ class VerizonConnectAPI:
         """
         return self._json_request(f"rad/v1/vehicles/getvehiclesactivedtcs")
 
+    @_validated
     def vehicle_gps_history(self, vehicle_number: str, start: datetime, end: datetime) -> list[VehicleGPSLocation]:
         """
         Gets GPS location history for a given vehicle.
@@ -182,8 +220,10 @@ class VerizonConnectAPI:
 
         return self._json_request(
             f"rad/v1/vehicles/{self._format_string(vehicle_number)}/status/"
-            f"history?startdatetimeutc={self._format_date(start)}&enddatetimeutc={self._format_date(end)}")
+            f"history?startdatetimeutc={self._format_date(start)}&enddatetimeutc={self._format_date(end)}",
+            priority=Priority.BULK)
 
+    @_validated
     def vehicle_segments(self, vehicle_number: str, start: datetime) -> list[SegmentHistory]:
         """
         Get a vehicle's ignition start and stop times for a 24-hour period.
@@ -201,8 +241,10 @@ class VerizonConnectAPI:
 
         return self._json_request(
             f"rad/v1/vehicles/{self._format_string(vehicle_number)}/"
-            f"segments?startdateutc={self._format_date(start)}")
+            f"segments?startdateutc={self._format_date(start)}",
+            priority=Priority.BULK)
 
+    @_validated
     def vehicle_dtc_history(self, vehicle_number: str) -> DiagnosticTroubleCodeHistory:
         """
         Gets diagnostic trouble code (DTC) history for a given vehicle.
@@ -215,8 +257,9 @@ class VerizonConnectAPI:
         :rtype: DiagnosticTroubleCodeHistory
         """
         return self._json_request(f"rad/v1/vehicles/{self._format_string(vehicle_number)}/"
-                                  f"getdtchistorybyvehiclenumber")
+                                  f"getdtchistorybyvehiclenumber", priority=Priority.BULK)
 
+    @_validated
     def vehicle_ecm_status(self, vehicle_number: str) -> EngineControlModuleStatus:
         """
         Gets status of vehicle's engine control module (ECM).
@@ -231,6 +274,7 @@ class VerizonConnectAPI:
         return self._json_request(f"rad/v1/vehicles/{self._format_string(vehicle_number)}/"
                                   f"getecmstatusbyvehiclenumber")
 
+    @_validated
     def vehicle_location(self, vehicle_number: str) -> LocationStatus:
         """
         Gets location information for a given vehicle.
@@ -244,6 +288,7 @@ class VerizonConnectAPI:
         return self._json_request(f"rad/v1/vehicles/{self._format_string(vehicle_number)}/"
                                   f"location")
 
+    @_validated
     def vehicle_status(self, vehicle_number: str) -> VehicleStatus:
         """
         Gets vehicle status for a given vehicle.
@@ -256,7 +301,24 @@ class VerizonConnectAPI:
         """
         return self._json_request(f"rad/v1/vehicles/{self._format_string(vehicle_number)}/status")
 
-    def _json_request(self, endpoint, retry=1):
+    def scheduler_stats(self) -> dict[Priority, PriorityStats]:
+        """
+        Gets queue depth and wait-time metrics for each request priority class.
+
+        :return: Dictionary of metrics keyed by priority class, empty if no scheduler is configured
+        :rtype: dict[Priority, PriorityStats]
+        """
+        if self._scheduler is None:
+            return {}
+        return self._scheduler.stats()
+
+    def _json_request(self, endpoint, retry=1, priority=Priority.INTERACTIVE):
+        """Fetches endpoint request through the scheduler, if configured"""
+        if self._scheduler is None:
+            return self._fetch_json(endpoint, retry)
+        return self._scheduler.run(priority, self._fetch_json, endpoint, retry)
+
+    def _fetch_json(self, endpoint, retry=1):
         """Fetches endpoint request and parses response to JSON (assumes correct endpoint encoding)"""
         response = requests.get(f'{self._URL_BASE}{endpoint}', headers={
             'Authorization': f'Atmosphere atmosphere_app_id={self._APP_ID}, Bearer {self._token}',
@@ -268,7 +330,7 @@ class VerizonConnectAPI:
 
         # Retry on error response (handles token expiration and occasional timeout)
         if response.status_code >= 400 and retry > 0:
-            return self._json_request(endpoint, retry=retry-1)
+            return self._fetch_json(endpoint, retry=retry-1)
 
         response.raise_for_status()
         return response.json()
@@ -1,2 +1,5 @@
 from . import VerizonConnectAPI
 from .VerizonConnectAPI import VerizonConnectAPI
+from .scheduler import Priority, RequestScheduler
+from .gps_codec import GPSTrackArchive, decode_gps_track, encode_gps_track
+from .validation import ResponseValidator
@@ -0,0 +1,525 @@
+import json
+import math
+import struct
+import zlib
+
+from calendar import timegm
+from datetime import datetime, timezone
+from typing import Optional
+
+from verizon_connect_api.api_types import VehicleGPSLocation
+
+_MAGIC = b'VCGT'
+_VERSION = 1
+
+# Timestamps with whole seconds or milliseconds, optionally followed by 'Z', are stored as deltas in their own unit.
+# The time kind combines these flags, anything else is kept as a string.
+_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
+_TIME_ZULU = 1
+_TIME_MILLISECONDS = 2
+_TIME_RAW = 4
+
+# Numeric fields stored as fixed-point deltas, with the scale giving their precision
+_NUMERIC_FIELDS = (
+    ('Latitude', 10 ** 7),
+    ('Longitude', 10 ** 7),
+    ('OdometerInKM', 10 ** 3),
+    ('Speed', 10 ** 2),
+    ('BatteryLevel', 10 ** 2),
+)
+_NUMBER_FIXED = 0
+_NUMBER_RAW = 1
+_NUMBER_INT = 2
+_NUMBER_NONE = 3
+
+# Fields stored as references into the string table, followed by the address table reference
+_STRING_FIELDS = (
+    'VehicleNumber',
+    'VehicleName',
+    'DriverNumber',
+    'FirstName',
+    'LastName',
+    'TractionBatteryChargingLastStartUtc',
+    'TractionBatteryChargingUtc',
+)
+_ADDRESS_FIELDS = ('AddressLine1', 'AddressLine2', 'Locality', 'AdministrativeArea', 'PostalCode', 'Country')
+_NUMERIC_NAMES = frozenset(name for name, _ in _NUMERIC_FIELDS)
+_RECORD_FIELDS = _STRING_FIELDS + tuple(name for name, _ in _NUMERIC_FIELDS) + ('UpdateUtc', 'IsPrivate')
+
+# Layout of the per-point header varint. References to the address, the string fields and the side record of
+# missing, extra or odd-typed fields are only written when they change from the previous point.
+_NUMERIC_SHIFT = 3
+_PRIVATE_BIT = 1 << (_NUMERIC_SHIFT + 2 * len(_NUMERIC_FIELDS))
+_CHANGED_SHIFT = _NUMERIC_SHIFT + 2 * len(_NUMERIC_FIELDS) + 1
+_REF_COUNT = len(_STRING_FIELDS) + 2
+_RAW_RECORD_BIT = 1 << (_CHANGED_SHIFT + _REF_COUNT)
+
+_FLOAT = struct.Struct('<d')
+_CHECKSUM = struct.Struct('<I')
+
+
+def encode_gps_track(points: list[VehicleGPSLocation], block_size: int = 256) -> bytes:
+    """
+    Encodes GPS history from :meth:`VerizonConnectAPI.vehicle_gps_history` into a compact archival format.
+
+    Timestamps, coordinates, odometer and speed are stored as fixed-point deltas packed into varints, and repeated
+    strings and addresses are stored once. Points are split into independently decodable blocks of ``block_size``
+    points, indexed by time range, so :class:`GPSTrackArchive` can decode a sub-range without inflating the whole
+    track. The tables and each block are checksummed with CRC-32, so corruption is detected when decoding.
+
+    Decoding is lossless: values that do not fit the compact encoding are stored as-is, and missing, extra or odd-typed
+    fields are kept in a deduplicated side record, so schema drift does not inflate the whole point.
+
+    :param points: List of GPS locations, ideally in time order
+    :type points: list[VehicleGPSLocation]
+    :param block_size: Number of points per block, defaults to 256
+    :type block_size: int
+    :return: Encoded track
+    :rtype: bytes
+    """
+    if block_size < 1:
+        raise ValueError('block_size must be at least 1')
+
+    strings = _Table()
+    addresses = _Table()
+    blocks = []
+    for i in range(0, len(points), block_size):
+        blocks.append(_encode_block(points[i:i + block_size], strings, addresses))
+
+    out = bytearray(_MAGIC)
+    out.append(_VERSION)
+    _write_varint(out, len(strings.values))
+    for value in strings.values:
+        encoded = value.encode('utf-8')
+        _write_varint(out, len(encoded))
+        out += encoded
+    _write_varint(out, len(addresses.values))
+    for address in addresses.values:
+        for index in address:
+            _write_varint(out, index)
+
+    _write_varint(out, len(blocks))
+    offset = 0
+    for data, count, time_range in blocks:
+        _write_varint(out, offset)
+        _write_varint(out, len(data))
+        _write_varint(out, count)
+        out += _CHECKSUM.pack(zlib.crc32(data))
+        if time_range is None:
+            out.append(0)
+        else:
+            out.append(1)
+            _write_varint(out, _zigzag(time_range[0]))
+            _write_varint(out, _zigzag(time_range[1]))
+        offset += len(data)
+    out += _CHECKSUM.pack(zlib.crc32(out))
+
+    for data, _, _ in blocks:
+        out += data
+    return bytes(out)
+
+
+def decode_gps_track(data: bytes, start: Optional[datetime] = None,
+                     end: Optional[datetime] = None) -> list[VehicleGPSLocation]:
+    """
+    Decodes a track encoded with :func:`encode_gps_track`, optionally limited to a time range.
+
+    :param data: Encoded track
+    :type data: bytes
+    :param start: UTC datetime at start of time range (inclusive), defaults to the start of the track
+    :type start: datetime
+    :param end: UTC datetime at end of time range (inclusive), defaults to the end of the track
+    :type end: datetime
+    :return: List of GPS locations
+    :rtype: list[VehicleGPSLocation]
+    """
+    return GPSTrackArchive(data).decode(start, end)
+
+
+class GPSTrackArchive:
+    """
+    Reads a track encoded with :func:`encode_gps_track`. The string, address and block tables are parsed once, and
+    only the blocks overlapping a requested time range are decoded.
+
+    :param data: Encoded track
+    :type data: bytes
+    """
+
+    def __init__(self, data: bytes):
+        if data[:len(_MAGIC)] != _MAGIC:
+            raise ValueError('Data is not an encoded GPS track')
+        if len(data) > len(_MAGIC) and data[len(_MAGIC)] != _VERSION:
+            raise ValueError(f'Unsupported GPS track version: {data[len(_MAGIC)]}')
+
+        self._data = data
+        try:
+            pos = len(_MAGIC) + 1
+
+            count, pos = _read_varint(data, pos)
+            self._strings = []
+            for _ in range(count):
+                length, pos = _read_varint(data, pos)
+                self._strings.append(data[pos:pos + length].decode('utf-8'))
+                pos += length
+
+            count, pos = _read_varint(data, pos)
+            self._addresses = []
+            for _ in range(count):
+                address = []
+                for _ in _ADDRESS_FIELDS:
+                    index, pos = _read_varint(data, pos)
+                    address.append(index)
+                self._addresses.append(tuple(address))
+
+            count, pos = _read_varint(data, pos)
+            blocks = []
+            for _ in range(count):
+                offset, pos = _read_varint(data, pos)
+                length, pos = _read_varint(data, pos)
+                points, pos = _read_varint(data, pos)
+                checksum = _CHECKSUM.unpack_from(data, pos)[0]
+                pos += _CHECKSUM.size
+                time_range = None
+                if data[pos]:
+                    first, pos = _read_varint(data, pos + 1)
+                    last, pos = _read_varint(data, pos)
+                    time_range = (_unzigzag(first), _unzigzag(last))
+                else:
+                    pos += 1
+                blocks.append((offset, length, points, checksum, time_range))
+
+            if _CHECKSUM.unpack_from(data, pos)[0] != zlib.crc32(data[:pos]):
+                raise ValueError('Table checksum does not match')
+            pos += _CHECKSUM.size
+        except (IndexError, UnicodeDecodeError, struct.error, ValueError) as e:
+            raise ValueError('Data is not an encoded GPS track') from e
+
+        if blocks and pos + blocks[-1][0] + blocks[-1][1] > len(data):
+            raise ValueError('Data is not an encoded GPS track')
+        self._blocks = [(pos + offset, length, points, checksum, time_range)
+                        for offset, length, points, checksum, time_range in blocks]
+
+    def __len__(self):
+        return sum(block[2] for block in self._blocks)
+
+    def decode(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> list[VehicleGPSLocation]:
+        """
+        Decodes GPS locations, optionally limited to a time range. When a range is given, points whose timestamp
+        could not be parsed are excluded.
+
+        :param start: UTC datetime at start of time range (inclusive), defaults to the start of the track
+        :type start: datetime
+        :param end: UTC datetime at end of time range (inclusive), defaults to the end of the track
+        :type end: datetime
+        :return: List of GPS locations
+        :rtype: list[VehicleGPSLocation]
+        """
+        if start is None and end is None:
+            points = []
+            for block in self._blocks:
+                points += (point for point, _ in self._decode_block(*block[:4]))
+            return points
+
+        first = -math.inf if start is None else _to_epoch(start) * 1000
+        last = math.inf if end is None else _to_epoch(end) * 1000
+        if not first <= last:
+            raise ValueError('Start datetime must be before end datetime')
+
+        points = []
+        for block in self._blocks:
+            time_range = block[4]
+            if time_range is not None and (time_range[1] < first or time_range[0] > last):
+                continue
+            points += (point for point, milliseconds in self._decode_block(*block[:4])
+                       if milliseconds is not None and first <= milliseconds <= last)
+        return points
+
+    def _decode_block(self, pos: int, length: int, count: int, checksum: int):
+        """Checks and decodes a block into a list of points with their timestamps, as yielded by _read_block"""
+        if zlib.crc32(self._data[pos:pos + length]) != checksum:
+            raise ValueError('Data is not an encoded GPS track')
+        try:
+            return list(self._read_block(pos, count))
+        except (IndexError, KeyError, TypeError, ValueError, OverflowError, OSError, struct.error) as e:
+            raise ValueError('Data is not an encoded GPS track') from e
+
+    def _read_block(self, pos: int, count: int):
+        """Yields each point in a block with its timestamp in milliseconds since epoch, or None if unparsed"""
+        data = self._data
+        strings = self._strings
+        previous_time = 0
+        previous_numbers = [0] * len(_NUMERIC_FIELDS)
+        previous_refs = [0] * _REF_COUNT
+
+        for _ in range(count):
+            header, pos = _read_varint(data, pos)
+            if header & _RAW_RECORD_BIT:
+                index, pos = _read_varint(data, pos)
+                yield json.loads(strings[index]), None
+                continue
+
+            point = {}
+            time_kind = header & 0b111
+            if time_kind == _TIME_RAW:
+                index, pos = _read_varint(data, pos)
+                point['UpdateUtc'] = strings[index - 1] if index else None
+                milliseconds = None
+            else:
+                delta, pos = _read_varint(data, pos)
+                unit = _time_unit(time_kind)
+                previous_time = milliseconds = (previous_time // unit + _unzigzag(delta)) * unit
+                point['UpdateUtc'] = _format_time(milliseconds, time_kind)
+
+            for i, (name, scale) in enumerate(_NUMERIC_FIELDS):
+                kind = (header >> (_NUMERIC_SHIFT + 2 * i)) & 0b11
+                if kind == _NUMBER_NONE:
+                    point[name] = None
+                elif kind == _NUMBER_RAW:
+                    point[name] = _FLOAT.unpack_from(data, pos)[0]
+                    pos += _FLOAT.size
+                else:
+                    delta, pos = _read_varint(data, pos)
+                    previous_numbers[i] += _unzigzag(delta)
+                    if kind == _NUMBER_INT:
+                        point[name] = previous_numbers[i] // scale
+                    else:
+                        point[name] = previous_numbers[i] / scale
+
+            point['IsPrivate'] = bool(header & _PRIVATE_BIT)
+
+            for i in range(len(previous_refs)):
+                if header & (1 << (_CHANGED_SHIFT + i)):
+                    previous_refs[i], pos = _read_varint(data, pos)
+            for name, index in zip(_STRING_FIELDS, previous_refs[1:-1]):
+                point[name] = strings[index - 1] if index else None
+            if previous_refs[0]:
+                point['Address'] = {name: strings[index - 1] if index else None
+                                    for name, index in zip(_ADDRESS_FIELDS, self._addresses[previous_refs[0] - 1])}
+            if previous_refs[-1]:
+                _apply_side_record(point, json.loads(strings[previous_refs[-1] - 1]))
+
+            yield point, milliseconds
+
+
+class _Table:
+    """Deduplicating table assigning each distinct value an index"""
+
+    def __init__(self):
+        self.values = []
+        self._indexes = {}
+
+    def index(self, value) -> int:
+        index = self._indexes.get(value)
+        if index is None:
+            index = self._indexes[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+
+def _encode_block(points: list[VehicleGPSLocation], strings: _Table, addresses: _Table):
+    """Encodes a block of points, returning the block data, point count and time range"""
+    out = bytearray()
+    previous_time = 0
+    previous_numbers = [0] * len(_NUMERIC_FIELDS)
+    previous_refs = [0] * _REF_COUNT
+    first_time = last_time = None
+
+    for point in points:
+        if not isinstance(point, dict):
+            _write_varint(out, _RAW_RECORD_BIT)
+            _write_varint(out, strings.index(json.dumps(point, separators=(',', ':'))))
+            continue
+
+        fields, address, side_record = _split_point(point)
+        body = bytearray()
+        try:
+            milliseconds, time_kind = _parse_time(fields['UpdateUtc'])
+        except (KeyError, ValueError):
+            time_kind = _TIME_RAW
+            _write_varint(body, _string_ref(strings, fields.get('UpdateUtc')))
+        else:
+            unit = _time_unit(time_kind)
+            _write_varint(body, _zigzag(milliseconds // unit - previous_time // unit))
+            previous_time = milliseconds
+            first_time = milliseconds if first_time is None else min(first_time, milliseconds)
+            last_time = milliseconds if last_time is None else max(last_time, milliseconds)
+        header = time_kind
+
+        for i, (name, scale) in enumerate(_NUMERIC_FIELDS):
+            value = fields.get(name)
+            kind, quantized = _quantize(value, scale)
+            if kind == _NUMBER_RAW:
+                body += _FLOAT.pack(value)
+            elif kind != _NUMBER_NONE:
+                _write_varint(body, _zigzag(quantized - previous_numbers[i]))
+                previous_numbers[i] = quantized
+            header |= kind << (_NUMERIC_SHIFT + 2 * i)
+
+        if fields.get('IsPrivate'):
+            header |= _PRIVATE_BIT
+
+        # The address changes most often, so it gets the lowest changed bit to keep headers short
+        refs = [0 if address is None else
+                addresses.index(tuple(_string_ref(strings, address.get(name)) for name in _ADDRESS_FIELDS)) + 1]
+        refs += (_string_ref(strings, fields.get(name)) for name in _STRING_FIELDS)
+        refs.append(0 if side_record is None else
+                    strings.index(json.dumps(side_record, separators=(',', ':'))) + 1)
+        for i, ref in enumerate(refs):
+            if ref != previous_refs[i]:
+                header |= 1 << (_CHANGED_SHIFT + i)
+                _write_varint(body, ref)
+        previous_refs = refs
+
+        _write_varint(out, header)
+        out += body
+
+    # Points with unparsed timestamps are never in a time range, so the block range only covers parsed points
+    time_range = None if first_time is None else (first_time, last_time)
+    return bytes(out), len(points), time_range
+
+
+def _split_point(point: dict):
+    """
+    Splits a point into the fields stored compactly, its address fields stored compactly (None if the address is not
+    a dictionary) and a side record of missing, extra and odd-typed fields (None if there are none)
+    """
+    fields = {}
+    side_record = {}
+    for key, value in point.items():
+        if key in _STRING_FIELDS:
+            fits = value is None or isinstance(value, str)
+        elif key in _NUMERIC_NAMES:
+            fits = value is None or (isinstance(value, (int, float)) and not isinstance(value, bool))
+        elif key == 'UpdateUtc':
+            fits = isinstance(value, str)
+        elif key == 'IsPrivate':
+            fits = isinstance(value, bool)
+        else:
+            fits = False
+        if fits:
+            fields[key] = value
+        elif not (key == 'Address' and isinstance(value, dict)):
+            side_record.setdefault('set', {})[key] = value
+
+    missing = [key for key in _RECORD_FIELDS if key not in point]
+    if missing:
+        side_record['missing'] = missing
+
+    address = point.get('Address')
+    if not isinstance(address, dict):
+        return fields, None, side_record or None
+
+    address_fields = {}
+    for key, value in address.items():
+        if key in _ADDRESS_FIELDS and (value is None or isinstance(value, str)):
+            address_fields[key] = value
+        else:
+            side_record.setdefault('address_set', {})[key] = value
+    missing = [key for key in _ADDRESS_FIELDS if key not in address]
+    if missing:
+        side_record['address_missing'] = missing
+    return fields, address_fields, side_record or None
+
+
+def _apply_side_record(point: dict, side_record: dict):
+    """Restores missing, extra and odd-typed fields from a side record onto a decoded point"""
+    if 'Address' in point:
+        for key in side_record.get('address_missing', ()):
+            del point['Address'][key]
+        point['Address'].update(side_record.get('address_set', {}))
+    for key in side_record.get('missing', ()):
+        del point[key]
+    point.update(side_record.get('set', {}))
+
+
+def _quantize(value, scale: int):
+    """Returns the numeric kind of a value and its fixed-point representation"""
+    if value is None:
+        return _NUMBER_NONE, 0
+    if isinstance(value, int):
+        return _NUMBER_INT, value * scale
+    # Large finite values can overflow to infinity once scaled
+    if math.isfinite(value * scale):
+        quantized = round(value * scale)
+        # Negative zero would decode as positive zero
+        if quantized / scale == value and (quantized or math.copysign(1.0, value) > 0):
+            return _NUMBER_FIXED, quantized
+    return _NUMBER_RAW, 0
+
+
+def _string_ref(strings: _Table, value: Optional[str]) -> int:
+    """Returns a string table reference, where 0 is None"""
+    return 0 if value is None else strings.index(value) + 1
+
+
+def _parse_time(value: str):
+    """Parses a timestamp that can be reproduced exactly, returning milliseconds since epoch and the time kind"""
+    time_kind = 0
+    text = value
+    if text.endswith('Z'):
+        time_kind |= _TIME_ZULU
+        text = text[:-1]
+
+    milliseconds = 0
+    if len(text) == 23 and text[19] == '.':
+        fraction = text[20:]
+        if not all(digit in '0123456789' for digit in fraction):
+            raise ValueError(f'Unsupported timestamp: {value}')
+        time_kind |= _TIME_MILLISECONDS
+        milliseconds = int(fraction)
+        text = text[:19]
+
+    parsed = datetime.strptime(text, _TIME_FORMAT)
+    if parsed.strftime(_TIME_FORMAT) != text:
+        raise ValueError(f'Unsupported timestamp: {value}')
+    return timegm(parsed.timetuple()) * 1000 + milliseconds, time_kind
+
+
+def _format_time(milliseconds: int, time_kind: int) -> str:
+    """Formats milliseconds since epoch as a timestamp of the given time kind"""
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    value = datetime.fromtimestamp(seconds, timezone.utc).strftime(_TIME_FORMAT)
+    if time_kind & _TIME_MILLISECONDS:
+        value += f'.{milliseconds:03}'
+    if time_kind & _TIME_ZULU:
+        value += 'Z'
+    return value
+
+
+def _time_unit(time_kind: int) -> int:
+    """Returns the unit of time deltas in milliseconds"""
+    return 1 if time_kind & _TIME_MILLISECONDS else 1000
+
+
+def _to_epoch(date: datetime) -> float:
+    """Converts a UTC datetime to seconds since epoch"""
+    if not date.tzinfo == timezone.utc:
+        raise ValueError('GPS track ranges only accept UTC datetimes')
+    return date.timestamp()
+
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def _write_varint(out: bytearray, value: int):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int):
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
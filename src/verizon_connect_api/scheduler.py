@@ -0,0 +1,171 @@
+import threading
+import time
+
+from collections import deque
+from enum import IntEnum
+from typing import Callable, Optional, TypedDict, TypeVar
+
+T = TypeVar('T')
+
+
+class Priority(IntEnum):
+    """Priority classes for API requests. Lower values are dispatched first under strict scheduling."""
+    INTERACTIVE = 0
+    BULK = 1
+
+
+class PriorityStats(TypedDict):
+    QueueDepth: int
+    InFlight: int
+    Dispatched: int
+    TotalWaitSeconds: float
+    MaxWaitSeconds: float
+    AverageWaitSeconds: float
+
+
+class _Ticket:
+    """Queued request waiting for a dispatch slot"""
+    __slots__ = ('priority', 'enqueued', 'ready')
+
+    def __init__(self, priority: Priority):
+        self.priority = priority
+        self.enqueued = time.monotonic()
+        self.ready = False
+
+
+class RequestScheduler:
+    """
+    Limits concurrent API requests and decides which queued request runs next, so interactive lookups are not stuck
+    behind bulk backfills sharing the same quota. Requests run on the calling thread; queued requests are never
+    cancelled, only reordered.
+
+    With the ``'strict'`` policy, a queued request of a higher priority class always goes ahead of queued requests of
+    lower classes. With the ``'weighted'`` policy, slots are shared between waiting classes in proportion to their
+    weights (smooth weighted round-robin), so bulk work keeps making progress under sustained interactive load.
+
+    :param max_concurrent: Maximum number of requests in flight at once, defaults to 1
+    :type max_concurrent: int
+    :param policy: Either ``'strict'`` or ``'weighted'``, defaults to ``'strict'``
+    :type policy: str
+    :param weights: Weight for each priority class under the ``'weighted'`` policy, defaults to 4:1 interactive to bulk
+    :type weights: dict[Priority, int]
+    """
+
+    def __init__(self, max_concurrent: int = 1, policy: str = 'strict', weights: Optional[dict[Priority, int]] = None):
+        if max_concurrent < 1:
+            raise ValueError('max_concurrent must be at least 1')
+        if policy not in ('strict', 'weighted'):
+            raise ValueError(f'Unknown scheduling policy: {policy}')
+
+        self._max_concurrent = max_concurrent
+        self._policy = policy
+        self._weights = {Priority.INTERACTIVE: 4, Priority.BULK: 1}
+        if weights is not None:
+            for priority in weights:
+                if not isinstance(priority, Priority):
+                    raise ValueError(f'Unknown priority class: {priority!r}')
+            self._weights.update(weights)
+        if any(weight < 1 for weight in self._weights.values()):
+            raise ValueError('Priority weights must be at least 1')
+
+        self._condition = threading.Condition()
+        self._queues: dict[Priority, deque[_Ticket]] = {priority: deque() for priority in Priority}
+        self._current_weights = {priority: 0 for priority in Priority}
+        self._in_flight = {priority: 0 for priority in Priority}
+        self._dispatched = {priority: 0 for priority in Priority}
+        self._total_wait = {priority: 0.0 for priority in Priority}
+        self._max_wait = {priority: 0.0 for priority in Priority}
+
+    def run(self, priority: Priority, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Waits for a dispatch slot for the given priority class, then calls ``func`` with the given arguments.
+
+        :param priority: Priority class of the request
+        :type priority: Priority
+        :param func: Function performing the request
+        :return: Return value of ``func``
+        """
+        self._acquire(priority)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._release(priority)
+
+    def stats(self) -> dict[Priority, PriorityStats]:
+        """
+        Gets queue depth and wait-time metrics for each priority class.
+
+        :return: Dictionary of metrics keyed by priority class
+        :rtype: dict[Priority, PriorityStats]
+        """
+        with self._condition:
+            return {priority: PriorityStats(
+                QueueDepth=len(self._queues[priority]),
+                InFlight=self._in_flight[priority],
+                Dispatched=self._dispatched[priority],
+                TotalWaitSeconds=self._total_wait[priority],
+                MaxWaitSeconds=self._max_wait[priority],
+                AverageWaitSeconds=(self._total_wait[priority] / self._dispatched[priority]
+                                    if self._dispatched[priority] else 0.0),
+            ) for priority in Priority}
+
+    def _acquire(self, priority: Priority):
+        """Queues a ticket and blocks until the ticket is dispatched"""
+        ticket = _Ticket(Priority(priority))
+        with self._condition:
+            self._queues[ticket.priority].append(ticket)
+            self._dispatch()
+            try:
+                while not ticket.ready:
+                    self._condition.wait()
+            except BaseException:
+                # Give up the ticket's place in the queue, or its slot if it was dispatched in the meantime
+                if ticket.ready:
+                    self._in_flight[ticket.priority] -= 1
+                    self._dispatch()
+                else:
+                    self._queues[ticket.priority].remove(ticket)
+                raise
+
+            wait = time.monotonic() - ticket.enqueued
+            self._dispatched[ticket.priority] += 1
+            self._total_wait[ticket.priority] += wait
+            self._max_wait[ticket.priority] = max(self._max_wait[ticket.priority], wait)
+
+    def _release(self, priority: Priority):
+        """Frees a slot and dispatches the next queued tickets"""
+        with self._condition:
+            self._in_flight[priority] -= 1
+            self._dispatch()
+
+    def _dispatch(self):
+        """Marks queued tickets ready while slots are free (caller must hold the condition)"""
+        dispatched = False
+        while sum(self._in_flight.values()) < self._max_concurrent:
+            priority = self._next_priority()
+            if priority is None:
+                break
+            ticket = self._queues[priority].popleft()
+            ticket.ready = True
+            self._in_flight[priority] += 1
+            dispatched = True
+
+        if dispatched:
+            self._condition.notify_all()
+
+    def _next_priority(self) -> Optional[Priority]:
+        """Picks the priority class to dispatch from according to the scheduling policy"""
+        waiting = [priority for priority in Priority if self._queues[priority]]
+        if not waiting:
+            return None
+
+        if self._policy == 'strict':
+            return min(waiting)
+
+        total = 0
+        for priority in waiting:
+            self._current_weights[priority] += self._weights[priority]
+            total += self._weights[priority]
+        selected = max(waiting, key=lambda p: self._current_weights[p])
+        self._current_weights[selected] -= total
+        return selected
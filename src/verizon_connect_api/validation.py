@@ -0,0 +1,250 @@
+import random
+import threading
+
+from collections import Counter
+from functools import lru_cache
+from types import NoneType, UnionType
+from typing import Any, Callable, Optional, TypedDict, Union, get_args, get_origin, get_type_hints, is_typeddict
+
+# Reports a drift kind, field path and observed type name
+Reporter = Callable[[str, str, str], None]
+Checker = Callable[[Any, str, Reporter], None]
+
+MISSING = 'missing'
+UNEXPECTED = 'unexpected'
+RETYPED = 'retyped'
+
+
+class SchemaDrift(TypedDict):
+    Endpoint: str
+    Kind: str
+    Path: str
+    Type: str
+    Count: int
+
+
+class ValidationStats(TypedDict):
+    Responses: int
+    Sampled: int
+    Drifted: int
+
+
+class ResponseValidator:
+    """
+    Checks a sample of API responses against the types in :mod:`verizon_connect_api.api_types` and counts schema
+    drift (missing, unexpected or retyped fields) instead of raising, so upstream changes show up before something
+    downstream breaks. Validators are compiled once per type, and only a fraction of responses from each endpoint are
+    checked.
+
+    Endpoints are named after the :class:`VerizonConnectAPI` method that fetched them, such as
+    ``'vehicle_gps_history'``.
+
+    :param default_rate: Fraction of responses to check for endpoints without a sample rate, defaults to 0.01
+    :type default_rate: float
+    :param sample_rates: Fraction of responses to check for specific endpoints
+    :type sample_rates: dict[str, float]
+    :param seed: Seed for the sampling random number generator, defaults to None
+    :type seed: int
+    """
+
+    def __init__(self, default_rate: float = 0.01, sample_rates: Optional[dict[str, float]] = None,
+                 seed: Optional[int] = None):
+        self._default_rate = default_rate
+        self._sample_rates = dict(sample_rates or {})
+        if any(not 0 <= rate <= 1 for rate in (default_rate, *self._sample_rates.values())):
+            raise ValueError('Sample rates must be between 0 and 1')
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._drift = Counter()
+        self._responses = Counter()
+        self._sampled = Counter()
+        self._drifted = Counter()
+
+    def validate(self, endpoint: str, response: Any, response_type: Any) -> bool:
+        """
+        Checks a response if it is sampled, counting any schema drift.
+
+        :param endpoint: Endpoint name used for sampling rates and reports
+        :type endpoint: str
+        :param response: Parsed JSON response
+        :param response_type: Expected type of the response
+        :return: True if the response was sampled and checked
+        :rtype: bool
+        """
+        rate = self._sample_rates.get(endpoint, self._default_rate)
+        with self._lock:
+            self._responses[endpoint] += 1
+            if not self._random.random() < rate:
+                return False
+
+        drift = Counter()
+        compile_validator(response_type)(response, '', lambda kind, path, type_name:
+                                         drift.update(((endpoint, kind, path, type_name),)))
+
+        with self._lock:
+            self._sampled[endpoint] += 1
+            if drift:
+                self._drifted[endpoint] += 1
+                self._drift.update(drift)
+        return True
+
+    def drift(self) -> list[SchemaDrift]:
+        """
+        Gets counts of each schema drift seen in sampled responses, most frequent first.
+
+        :return: List of dictionaries with endpoint, drift kind, field path, observed type and count
+        :rtype: list[SchemaDrift]
+        """
+        with self._lock:
+            return [SchemaDrift(Endpoint=endpoint, Kind=kind, Path=path, Type=type_name, Count=count)
+                    for (endpoint, kind, path, type_name), count in self._drift.most_common()]
+
+    def stats(self) -> dict[str, ValidationStats]:
+        """
+        Gets response, sampled and drifted response counts for each endpoint.
+
+        :return: Dictionary of counts keyed by endpoint
+        :rtype: dict[str, ValidationStats]
+        """
+        with self._lock:
+            return {endpoint: ValidationStats(Responses=self._responses[endpoint], Sampled=self._sampled[endpoint],
+                                              Drifted=self._drifted[endpoint])
+                    for endpoint in self._responses}
+
+
+@lru_cache(maxsize=None)
+def compile_validator(expected: Any) -> Checker:
+    """
+    Compiles a checker for a type, called with a value, its field path and a function reporting each drift. Checks
+    follow pydantic's strict mode, as used by the test suite.
+
+    :param expected: TypedDict, list, Optional/Union or scalar type
+    :return: Checker function
+    """
+    if is_typeddict(expected):
+        return _compile_typeddict(expected)
+
+    origin = get_origin(expected)
+    if origin is list:
+        return _compile_list(get_args(expected)[0])
+    if origin is Union or origin is UnionType:
+        return _compile_union(get_args(expected))
+
+    if expected is Any:
+        return _accept
+    if expected is float:
+        return _compile_scalar((int, float))
+    if expected is int:
+        return _compile_scalar(int)
+    if isinstance(expected, type):
+        return _compile_scalar(expected)
+    return _accept
+
+
+def _accept(value: Any, path: str, report: Reporter):
+    pass
+
+
+def _join(path: str, key: str) -> str:
+    return f'{path}.{key}' if path else key
+
+
+def _compile_scalar(expected) -> Checker:
+    # bool is a subclass of int, but not a valid int or float in strict mode
+    allow_bool = expected is bool
+
+    def check(value, path, report):
+        if not isinstance(value, expected) or (isinstance(value, bool) and not allow_bool):
+            report(RETYPED, path, type(value).__name__)
+
+    return check
+
+
+def _compile_typeddict(expected) -> Checker:
+    fields = {key: (compile_validator(hint), key in expected.__required_keys__, _exact_types(hint))
+              for key, hint in get_type_hints(expected).items()}
+
+    def check(value, path, report):
+        if not isinstance(value, dict):
+            report(RETYPED, path, type(value).__name__)
+            return
+
+        matched = 0
+        for key, (checker, required, exact_types) in fields.items():
+            if key in value:
+                matched += 1
+                # Skip building the field path for scalars of exactly the expected type
+                if exact_types is None or type(value[key]) not in exact_types:
+                    checker(value[key], _join(path, key), report)
+            elif required:
+                report(MISSING, _join(path, key), '')
+
+        if matched < len(value):
+            for key in value.keys() - fields.keys():
+                report(UNEXPECTED, _join(path, key), type(value[key]).__name__)
+
+    return check
+
+
+def _exact_types(expected) -> Optional[frozenset]:
+    """Returns the exact types valid for a scalar or optional scalar type, or None for other types"""
+    origin = get_origin(expected)
+    options = get_args(expected) if origin is Union or origin is UnionType else (expected,)
+    types = set()
+    for option in options:
+        if option is float:
+            types.update((int, float))
+        elif option in (str, int, bool, NoneType):
+            types.add(option)
+        else:
+            return None
+    return frozenset(types)
+
+
+def _compile_list(item_type) -> Checker:
+    item_checker = compile_validator(item_type)
+
+    def check(value, path, report):
+        if not isinstance(value, list):
+            report(RETYPED, path, type(value).__name__)
+            return
+
+        item_path = f'{path}[]'
+        for item in value:
+            item_checker(item, item_path, report)
+
+    return check
+
+
+def _compile_union(options) -> Checker:
+    optional = NoneType in options
+    checkers = [compile_validator(option) for option in options if option is not NoneType]
+
+    if len(checkers) == 1:
+        checker = checkers[0]
+
+        def check(value, path, report):
+            if value is None and optional:
+                return
+            checker(value, path, report)
+
+        return check
+
+    def check(value, path, report):
+        if value is None and optional:
+            return
+
+        # Report the drift of the closest matching option
+        closest = None
+        for checker in checkers:
+            drift = []
+            checker(value, path, lambda *args: drift.append(args))
+            if not drift:
+                return
+            if closest is None or len(drift) < len(closest):
+                closest = drift
+        for args in closest:
+            report(*args)
+
+    return check
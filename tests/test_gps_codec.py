@@ -0,0 +1,106 @@
+from unittest import TestCase
+from datetime import datetime, timezone
+from verizon_connect_api.gps_codec import GPSTrackArchive, decode_gps_track, encode_gps_track
+
+
+def gps_location(minute: int, **overrides) -> dict:
+    location = {
+        'Latitude': 43.038902 + minute / 1000,
+        'Longitude': -87.906471,
+        'VehicleNumber': '1042',
+        'VehicleName': 'Truck 1042',
+        'OdometerInKM': 152340.5 + minute,
+        'UpdateUtc': f'2024-07-01T12:{minute:02}:00',
+        'IsPrivate': False,
+        'DriverNumber': None,
+        'FirstName': None,
+        'LastName': None,
+        'Address': {
+            'AddressLine1': '123 Main St',
+            'AddressLine2': '',
+            'Locality': 'Milwaukee',
+            'AdministrativeArea': 'WI',
+            'PostalCode': '53202',
+            'Country': 'USA',
+        },
+        'Speed': 42.5,
+        'BatteryLevel': None,
+        'TractionBatteryChargingLastStartUtc': None,
+        'TractionBatteryChargingUtc': None,
+    }
+    location.update(overrides)
+    return location
+
+
+class TestGPSCodec(TestCase):
+    def test_round_trip(self):
+        track = [gps_location(minute) for minute in range(60)]
+        self.assertEqual(decode_gps_track(encode_gps_track(track, block_size=7)), track)
+
+    def test_round_trip_irregular_values(self):
+        track = [
+            gps_location(0, Speed=0, IsPrivate=True, BatteryLevel=87.25),
+            gps_location(1, Latitude=43.123456789012345, Longitude=-0.0),
+            gps_location(2, UpdateUtc='2024-07-01T12:02:00.123Z', DriverNumber='D-1', FirstName='Jamie'),
+            gps_location(3, Address=None),
+            gps_location(4, Unexpected='field'),
+            gps_location(5, Latitude=1e302, Speed='fast', IsPrivate=None),
+            gps_location(6, Address={'AddressLine1': '1 Main St', 'Unit': 4}),
+            [1, 2, 3],
+        ]
+        del track[2]['BatteryLevel']
+        del track[3]['UpdateUtc']
+        decoded = decode_gps_track(encode_gps_track(track))
+        self.assertEqual(decoded, track)
+        self.assertIsInstance(decoded[0]['Speed'], int)
+        self.assertEqual(str(decoded[1]['Longitude']), '-0.0')
+
+    def test_extra_field_size(self):
+        track = [gps_location(minute) for minute in range(60)]
+        drifted = [gps_location(minute, Heading='NESW'[minute % 4]) for minute in range(60)]
+        size = len(encode_gps_track(track))
+        drifted_size = len(encode_gps_track(drifted))
+        self.assertEqual(decode_gps_track(encode_gps_track(drifted)), drifted)
+        self.assertLess(drifted_size, size * 1.5)
+
+    def test_time_range(self):
+        track = [gps_location(minute) for minute in range(60)]
+        archive = GPSTrackArchive(encode_gps_track(track, block_size=10))
+        self.assertEqual(len(archive), 60)
+
+        start = datetime(2024, 7, 1, 12, 15, tzinfo=timezone.utc)
+        end = datetime(2024, 7, 1, 12, 24, tzinfo=timezone.utc)
+        self.assertEqual(archive.decode(start, end), track[15:25])
+        self.assertEqual(archive.decode(start=end), track[24:])
+
+        with self.assertRaises(ValueError):
+            archive.decode(datetime(2024, 7, 1, 12, 15))
+
+    def test_millisecond_timestamps(self):
+        track = [gps_location(minute, UpdateUtc=f'2024-07-01T12:{minute:02}:00.{minute * 7:03}Z')
+                 for minute in range(60)]
+        track[3]['UpdateUtc'] = '2024-07-01T12:03:00.5Z'
+        archive = GPSTrackArchive(encode_gps_track(track, block_size=10))
+        self.assertEqual(archive.decode(), track)
+        self.assertTrue(all(block[4] is not None for block in archive._blocks))
+
+        start = datetime(2024, 7, 1, 12, 15, tzinfo=timezone.utc)
+        end = datetime(2024, 7, 1, 12, 24, 0, 168000, tzinfo=timezone.utc)
+        self.assertEqual(archive.decode(start, end), track[15:25])
+
+    def test_corrupt_data(self):
+        data = encode_gps_track([gps_location(minute) for minute in range(60)], block_size=20)
+        for i in range(len(data)):
+            corrupt = bytearray(data)
+            corrupt[i] ^= 0x10
+            with self.assertRaises(ValueError):
+                decode_gps_track(bytes(corrupt))
+
+    def test_invalid_data(self):
+        with self.assertRaises(ValueError):
+            GPSTrackArchive(b'not a track')
+
+        data = encode_gps_track([gps_location(minute) for minute in range(60)])
+        for truncated in (b'VCGT', b'VCGT\x01\x05', data[:len(data) // 2], data[:-1]):
+            with self.assertRaises(ValueError):
+                GPSTrackArchive(truncated)
@@ -0,0 +1,85 @@
+import threading
+import time
+
+from unittest import TestCase
+from verizon_connect_api.scheduler import Priority, RequestScheduler
+
+
+class TestRequestScheduler(TestCase):
+    def run_queued(self, scheduler: RequestScheduler, priorities: list[Priority]) -> list[Priority]:
+        """Queues requests behind a blocking request and returns the order they were dispatched in"""
+        order = []
+        release = threading.Event()
+        blocker = threading.Thread(target=scheduler.run, args=(Priority.BULK, release.wait))
+        blocker.start()
+        while scheduler.stats()[Priority.BULK]['InFlight'] == 0:
+            time.sleep(0.001)
+
+        threads = []
+        for priority in priorities:
+            thread = threading.Thread(target=scheduler.run, args=(priority, order.append, priority))
+            thread.start()
+            threads.append(thread)
+            while sum(stats['QueueDepth'] for stats in scheduler.stats().values()) < len(threads):
+                time.sleep(0.001)
+
+        release.set()
+        blocker.join()
+        for thread in threads:
+            thread.join()
+        return order
+
+    def test_strict_priority(self):
+        scheduler = RequestScheduler()
+        order = self.run_queued(scheduler, [Priority.BULK, Priority.BULK, Priority.INTERACTIVE])
+        self.assertEqual(order, [Priority.INTERACTIVE, Priority.BULK, Priority.BULK])
+
+    def test_weighted_priority(self):
+        scheduler = RequestScheduler(policy='weighted', weights={Priority.INTERACTIVE: 2, Priority.BULK: 1})
+        order = self.run_queued(scheduler, [Priority.BULK] * 3 + [Priority.INTERACTIVE] * 3)
+        self.assertEqual(order[:3], [Priority.INTERACTIVE, Priority.BULK, Priority.INTERACTIVE])
+        self.assertEqual(sorted(order), sorted([Priority.BULK] * 3 + [Priority.INTERACTIVE] * 3))
+
+    def test_stats(self):
+        scheduler = RequestScheduler()
+        self.run_queued(scheduler, [Priority.INTERACTIVE])
+        stats = scheduler.stats()
+        self.assertEqual(stats[Priority.INTERACTIVE]['Dispatched'], 1)
+        self.assertEqual(stats[Priority.BULK]['Dispatched'], 1)
+        self.assertEqual(stats[Priority.INTERACTIVE]['QueueDepth'], 0)
+        self.assertGreater(stats[Priority.INTERACTIVE]['MaxWaitSeconds'], 0)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            RequestScheduler(max_concurrent=0)
+        with self.assertRaises(ValueError):
+            RequestScheduler(policy='fifo')
+        for weights in ({'bulk': 3}, {2: 3}, {Priority.BULK: 0}):
+            with self.assertRaises(ValueError):
+                RequestScheduler(policy='weighted', weights=weights)
+
+    def test_interrupted_wait(self):
+        scheduler = RequestScheduler()
+        release = threading.Event()
+        blocker = threading.Thread(target=scheduler.run, args=(Priority.BULK, release.wait))
+        blocker.start()
+        while scheduler.stats()[Priority.BULK]['InFlight'] == 0:
+            time.sleep(0.001)
+
+        # Interrupt a queued request, then let the blocking request finish
+        wait = scheduler._condition.wait
+
+        def interrupted_wait(*args, **kwargs):
+            scheduler._condition.wait = wait
+            raise KeyboardInterrupt
+
+        scheduler._condition.wait = interrupted_wait
+        with self.assertRaises(KeyboardInterrupt):
+            scheduler.run(Priority.INTERACTIVE, lambda: None)
+        release.set()
+        blocker.join()
+
+        stats = scheduler.stats()
+        self.assertEqual(stats[Priority.INTERACTIVE]['QueueDepth'], 0)
+        self.assertEqual(stats[Priority.INTERACTIVE]['InFlight'], 0)
+        self.assertEqual(scheduler.run(Priority.INTERACTIVE, lambda: 'done'), 'done')
@@ -0,0 +1,56 @@
+from unittest import TestCase
+from verizon_connect_api.api_types import *
+from verizon_connect_api.validation import ResponseValidator, compile_validator
+
+
+def ecm_status(**overrides) -> dict:
+    status = {key: None for key in EngineControlModuleStatus.__annotations__}
+    status['VIN'] = '1FTFW1ET5DFC10312'
+    status.update(overrides)
+    return status
+
+
+class TestResponseValidator(TestCase):
+    def test_valid_response(self):
+        validator = ResponseValidator(default_rate=1)
+        self.assertTrue(validator.validate('vehicle_ecm_status', ecm_status(Speed=12, DTCs=['P0420']),
+                                           EngineControlModuleStatus))
+        self.assertEqual(validator.drift(), [])
+        self.assertEqual(validator.stats(), {'vehicle_ecm_status': {'Responses': 1, 'Sampled': 1, 'Drifted': 0}})
+
+    def test_drift_counters(self):
+        validator = ResponseValidator(default_rate=1)
+        status = ecm_status(EngineMinutes=10, VIN=None, DTCs=['P0420', 7])
+        del status['EngineMintutes']
+        for _ in range(3):
+            validator.validate('vehicle_ecm_status', [status], list[EngineControlModuleStatus])
+
+        drift = {(d['Kind'], d['Path'], d['Type']): d['Count'] for d in validator.drift()}
+        self.assertEqual(drift, {
+            ('missing', '[].EngineMintutes', ''): 3,
+            ('unexpected', '[].EngineMinutes', 'int'): 3,
+            ('retyped', '[].VIN', 'NoneType'): 3,
+            ('retyped', '[].DTCs[]', 'int'): 3,
+        })
+        self.assertEqual(validator.stats()['vehicle_ecm_status']['Drifted'], 3)
+
+    def test_union_and_not_required(self):
+        check = compile_validator(UserResponse)
+        drift = []
+        user = {'FirstName': 'Jamie', 'LastName': 'Smith', 'EmailAddress': 'jamie@example.com', 'EmployeeId': 4,
+                'IsAdministrator': False, 'IsRegionalAdministrator': False, 'Role': None, 'IsDriver': True}
+        check({'user': user, '_links': None}, '', lambda *args: drift.append(args))
+        compile_validator(DriverLinks)({'Self': {'Href': '/drivers/1'}}, '', lambda *args: drift.append(args))
+        self.assertEqual(drift, [])
+
+        check({'user': dict(user, IsDriver=1), '_links': None}, '', lambda *args: drift.append(args))
+        self.assertEqual(drift, [('retyped', 'user.IsDriver', 'int')])
+
+    def test_sampling(self):
+        validator = ResponseValidator(default_rate=0, sample_rates={'vehicle_status': 1})
+        self.assertFalse(validator.validate('vehicle_location', {}, LocationStatus))
+        self.assertTrue(validator.validate('vehicle_status', {}, VehicleStatus))
+        self.assertEqual(validator.stats()['vehicle_location'], {'Responses': 1, 'Sampled': 0, 'Drifted': 0})
+
+        with self.assertRaises(ValueError):
+            ResponseValidator(default_rate=2)